@@ -0,0 +1,48 @@
+"""On-disk cache helpers for runna-intervals.
+
+Cached data lives under ~/.cache/runna-intervals (honouring $XDG_CACHE_HOME).
+The cache is purely an optimisation: every reader falls back to uncached
+behaviour when a file is missing, stale, or unreadable.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Return the runna-intervals cache directory, creating it if necessary."""
+    root = os.environ.get("XDG_CACHE_HOME")
+    base = Path(root) if root else Path.home() / ".cache"
+    path = base / "runna-intervals"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def read_json(path: Path) -> dict | None:  # type: ignore[type-arg]
+    """Best-effort read of a JSON cache file. Returns None on any failure."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_json_atomic(path: Path, data: dict) -> None:  # type: ignore[type-arg]
+    """Best-effort atomic write of a JSON cache file (tmp file + rename)."""
+    try:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Best-effort atomic write of a text cache file (tmp file + rename)."""
+    try:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
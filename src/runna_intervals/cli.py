@@ -7,16 +7,22 @@ Usage:
     runna-intervals list-events --start 2024-01-01 --end 2024-01-31
 """
 
+import hashlib
 from datetime import date, timedelta
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from runna_intervals.config import _LOCAL_ENV, Settings
-from runna_intervals.intervals_client import IntervalsAPIError, IntervalsClient
+from runna_intervals.cache import cache_dir, read_json, write_json_atomic
+
+# Heavier imports (pydantic/pydantic-settings via config, httpx via
+# intervals_client, rich.table/rich.panel, orjson, the ICS parser) are
+# deferred into the commands that need them so `--help` and `config`
+# don't pay cold-start cost for the sync machinery.
+if TYPE_CHECKING:
+    from runna_intervals.config import Settings
+    from runna_intervals.models.intervals import IntervalsEvent
 
 app = typer.Typer(
     name="runna-intervals",
@@ -34,9 +40,11 @@ err_console = Console(stderr=True)
 # ---------------------------------------------------------------------------
 
 
-def _get_settings() -> Settings:
+def _get_settings() -> "Settings":
+    from runna_intervals.config import get_settings
+
     try:
-        return Settings()  # type: ignore[call-arg]
+        return get_settings()
     except Exception as exc:
         err_console.print(f"[red]Configuration error:[/red] {exc}")
         err_console.print(
@@ -45,6 +53,15 @@ def _get_settings() -> Settings:
         raise typer.Exit(1) from None
 
 
+def _event_fingerprint(event: "IntervalsEvent") -> str:
+    """Stable content hash of an event's upload payload."""
+    import orjson
+
+    return hashlib.sha256(
+        orjson.dumps(event.model_dump(exclude_none=True), option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -61,6 +78,10 @@ def config(
 
     Credentials are saved to [cyan].env[/cyan] in the current directory.
     """
+    from rich.panel import Panel
+
+    from runna_intervals.config import _LOCAL_ENV
+
     if show:
         if _LOCAL_ENV.exists():
             text = _LOCAL_ENV.read_text()
@@ -166,6 +187,13 @@ def sync(
             "(e.g. 480 = 8:00/mi). Overrides RUNNA_INTERVALS_EASY_PACE_SEC_MI in .env.",
         ),
     ] = None,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            help="Upload all workouts, even ones unchanged since the last sync.",
+        ),
+    ] = False,
 ) -> None:
     """Fetch your Runna calendar and sync workouts to Intervals.icu.
 
@@ -185,12 +213,16 @@ def sync(
         runna-intervals sync --miles                  # use miles/min-per-mile
         runna-intervals sync --easy-pace 480          # override easy pace to 8:00/mi
     """
+    from rich.table import Table
+
+    from runna_intervals.config import get_settings
+
     # Resolve the ICS URL without requiring the Intervals.icu API key yet.
     # (API key is only needed when actually uploading, not for dry-run.)
     url = ics_url
     if not url:
         try:
-            url = Settings().runna_ics_url  # type: ignore[call-arg]
+            url = get_settings().runna_ics_url
         except Exception:
             pass  # Settings missing — will fail below with a clear message
     if not url:
@@ -213,7 +245,7 @@ def sync(
     _easy_pace = easy_pace
     if _easy_pace is None:
         try:
-            _easy_pace = Settings().easy_pace_sec_mi  # type: ignore[call-arg]
+            _easy_pace = get_settings().easy_pace_sec_mi
         except Exception:
             pass  # API key missing is fine here; default baked into parse_ics_to_events
 
@@ -232,6 +264,7 @@ def sync(
         use_miles=use_miles,
         easy_pace_sec_mi=_easy_pace,
         skipped=skipped,
+        limit=limit,
     )
     for skipped_date, skipped_name in skipped:
         err_console.print(
@@ -239,9 +272,6 @@ def sync(
             "could not parse workout description.[/yellow]"
         )
 
-    if limit is not None:
-        events = events[:limit]
-
     if not events:
         date_range = ""
         if start or end:
@@ -249,31 +279,74 @@ def sync(
         console.print(f"[yellow]No upcoming workouts found{date_range}.[/yellow]")
         return
 
+    # Display fields are needed by both the summary table and the
+    # --show-desc panels — compute them once.
+    rows = [
+        (
+            ev.start_date_local[:10],
+            ev.name,
+            f"{ev.moving_time // 60}m {ev.moving_time % 60:02d}s",
+        )
+        for ev in events
+    ]
+
     table = Table(title=f"Runna → Intervals.icu ({len(events)} workout(s))")
     table.add_column("Date", style="cyan", no_wrap=True)
     table.add_column("Name", style="bold")
     table.add_column("Duration", justify="right")
 
-    for ev in events:
-        mins, secs = divmod(ev.moving_time, 60)
-        table.add_row(ev.start_date_local[:10], ev.name, f"{mins}m {secs:02d}s")
+    for date_str, name, duration_str in rows:
+        table.add_row(date_str, name, duration_str)
 
     console.print(table)
 
     if show_desc:
-        for ev in events:
-            console.print(
-                Panel(
-                    f"[dim]{ev.description}[/dim]",
-                    title=f"{ev.start_date_local[:10]} — {ev.name}",
-                    border_style="dim",
+        from rich.console import Group
+        from rich.panel import Panel
+
+        # One print of a Group lets rich compute layout once and stream all
+        # panels, instead of a full render pass per workout.
+        console.print(
+            Group(
+                *(
+                    Panel(
+                        f"[dim]{ev.description}[/dim]",
+                        title=f"{date_str} — {name}",
+                        border_style="dim",
+                    )
+                    for ev, (date_str, name, _) in zip(events, rows, strict=True)
                 )
             )
+        )
 
     if dry_run:
         console.print("[yellow]Dry run — not uploading.[/yellow]")
         return
 
+    # Skip events whose payload is byte-identical to what was uploaded last
+    # time (tracked in a local external_id → sha256 manifest).
+    manifest_path = cache_dir() / "manifest.json"
+    manifest = (read_json(manifest_path) or {}) if not force else {}
+    fingerprints = {
+        ev.external_id: _event_fingerprint(ev) for ev in events if ev.external_id
+    }
+    to_upload = [
+        ev
+        for ev in events
+        if not ev.external_id or manifest.get(ev.external_id) != fingerprints[ev.external_id]
+    ]
+    unchanged = len(events) - len(to_upload)
+    if unchanged:
+        console.print(
+            f"[dim]{unchanged} workout(s) unchanged since last sync — skipping "
+            "(use --force to re-upload).[/dim]"
+        )
+    if not to_upload:
+        console.print("[green]✓ Everything already up to date on Intervals.icu.[/green]")
+        return
+
+    from runna_intervals.intervals_client import IntervalsAPIError, IntervalsClient
+
     settings = _get_settings()
     with IntervalsClient(
         api_key=settings.intervals_api_key,
@@ -281,11 +354,17 @@ def sync(
         base_url=settings.intervals_base_url,
     ) as client:
         try:
-            results = client.upload_events(events)
+            results = client.upload_events(to_upload)
         except IntervalsAPIError as exc:
             err_console.print(f"[red]Upload failed:[/red] {exc}")
             raise typer.Exit(1) from None
 
+    manifest = read_json(manifest_path) or {}
+    for ev in to_upload:
+        if ev.external_id:
+            manifest[ev.external_id] = fingerprints[ev.external_id]
+    write_json_atomic(manifest_path, manifest)
+
     console.print(
         f"[green]✓ Synced {len(results)} workout(s) to Intervals.icu![/green]"
     )
@@ -297,6 +376,10 @@ def list_events(
     end: Annotated[str, typer.Option("--end", help="End date (YYYY-MM-DD).")],
 ) -> None:
     """List planned workout events on Intervals.icu for a date range."""
+    from rich.table import Table
+
+    from runna_intervals.intervals_client import IntervalsAPIError, IntervalsClient
+
     settings = _get_settings()
     with IntervalsClient(
         api_key=settings.intervals_api_key,
@@ -377,6 +460,10 @@ def delete(
         runna-intervals delete --future --dry-run
         runna-intervals delete --future --yes
     """
+    from rich.table import Table
+
+    from runna_intervals.intervals_client import IntervalsAPIError, IntervalsClient
+
     if not future and start is None and end is None:
         err_console.print(
             "[red]Error:[/red] Specify at least one of --start, --end, or --future."
@@ -384,12 +471,14 @@ def delete(
         raise typer.Exit(1)
 
     # Resolve effective date range
+    today = date.today()
+    two_years_out = (today + timedelta(days=730)).isoformat()
     if future:
-        effective_start = start or date.today().isoformat()
-        effective_end = end or (date.today() + timedelta(days=730)).isoformat()
+        effective_start = start or today.isoformat()
+        effective_end = end or two_years_out
     else:
         effective_start = start or "2000-01-01"
-        effective_end = end or (date.today() + timedelta(days=730)).isoformat()
+        effective_end = end or two_years_out
 
     settings = _get_settings()
     with IntervalsClient(
@@ -401,12 +490,19 @@ def delete(
             f"[dim]Fetching events between {effective_start} and {effective_end}…[/dim]"
         )
         try:
-            all_events = client.get_events(effective_start, effective_end)
+            all_events = client.get_events(
+                effective_start,
+                effective_end,
+                external_id_prefix="runna-",
+                fields="id,external_id,start_date_local,name",
+            )
         except IntervalsAPIError as exc:
             err_console.print(f"[red]Failed to fetch events:[/red] {exc}")
             raise typer.Exit(1) from None
 
-        # Keep only events uploaded by runna-intervals
+        # Keep only events uploaded by runna-intervals. The server-side prefix
+        # filter is advisory — this guard is what guarantees nothing else is
+        # ever deleted.
         runna_events = [
             ev
             for ev in all_events
@@ -420,17 +516,24 @@ def delete(
             )
             return
 
+        # Display fields are reused for error reporting after the deletes —
+        # compute them once.
+        rows = [
+            (
+                (ev.get("start_date_local") or "")[:10],
+                ev.get("name") or "",
+                ev.get("id"),
+            )
+            for ev in runna_events
+        ]
+
         table = Table(title=f"Runna Events to Delete ({len(runna_events)})")
         table.add_column("Date", style="cyan", no_wrap=True)
         table.add_column("Name", style="bold")
         table.add_column("ID", style="dim")
 
-        for ev in runna_events:
-            table.add_row(
-                (ev.get("start_date_local") or "")[:10],
-                ev.get("name") or "",
-                str(ev.get("id") or ""),
-            )
+        for date_str, name, event_id in rows:
+            table.add_row(date_str, name, str(event_id or ""))
 
         console.print(table)
 
@@ -444,23 +547,25 @@ def delete(
                 abort=True,
             )
 
+        # Map IDs back to display info for error reporting
+        event_info = {
+            int(event_id): (date_str, name)
+            for date_str, name, event_id in rows
+            if event_id
+        }
+
         deleted = 0
         failed = 0
-        for ev in runna_events:
-            event_id = ev.get("id")
-            if not event_id:
-                continue
-            try:
-                client.delete_event(int(event_id))
+        for event_id, error in client.delete_events(list(event_info)):
+            if error is None:
                 deleted += 1
-            except IntervalsAPIError as exc:
-                date_str = (ev.get("start_date_local") or "")[:10]
-                name_str = ev.get("name") or ""
-                err_console.print(
-                    f"[red]Failed to delete event {event_id} "
-                    f"({date_str} {name_str}):[/red] {exc}"
-                )
-                failed += 1
+                continue
+            date_str, name_str = event_info[event_id]
+            err_console.print(
+                f"[red]Failed to delete event {event_id} "
+                f"({date_str} {name_str}):[/red] {error}"
+            )
+            failed += 1
 
     console.print(
         f"[green]✓ Deleted {deleted} Runna event(s) from Intervals.icu.[/green]"
@@ -6,6 +6,8 @@ with environment variables taking highest priority.
 Run `runna-intervals config` to create the .env file interactively.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import SecretStr
@@ -34,5 +36,18 @@ class Settings(BaseSettings):
     easy_pace_sec_mi: int = 520
 
 
-def get_settings() -> Settings:
+@lru_cache(maxsize=1)
+def _cached_settings() -> Settings:
     return Settings()  # type: ignore[call-arg]
+
+
+def get_settings() -> Settings:
+    """Return the parsed Settings, reading .env at most once per process.
+
+    Environment variables still take precedence (pydantic-settings reads them
+    on construction); set RUNNA_INTERVALS_NO_CACHE=1 to force a fresh read of
+    the .env file on every call.
+    """
+    if os.environ.get("RUNNA_INTERVALS_NO_CACHE"):
+        return Settings()  # type: ignore[call-arg]
+    return _cached_settings()
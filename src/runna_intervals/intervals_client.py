@@ -6,13 +6,22 @@ and password is your API key from intervals.icu → Settings → Developer Setti
 API docs: https://intervals.icu/api/v1/docs/swagger-ui/index.html
 """
 
+import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import httpx
+import orjson
 from pydantic import SecretStr
 
 from runna_intervals.models.intervals import IntervalsEvent
 
 _BASE_URL = "https://intervals.icu"
 
+# Events per bulk-upload POST. Chunks are dispatched in parallel so a large
+# sync overlaps server-side processing and a transient failure only voids
+# one chunk (upsert makes re-running the rest safe).
+_UPLOAD_CHUNK_SIZE = 50
+
 
 class IntervalsAPIError(Exception):
     """Raised when the Intervals.icu API returns an error response."""
@@ -33,11 +42,27 @@ class IntervalsClient:
     ) -> None:
         self._athlete_id = athlete_id
         self._base_url = base_url.rstrip("/")
+        # Precompute the Basic auth header once instead of letting httpx
+        # rebuild it (base64 + concat) for every request.
+        token = base64.b64encode(
+            f"API_KEY:{api_key.get_secret_value()}".encode()
+        ).decode()
+        # HTTP/2 multiplexes concurrent requests (e.g. delete_events) over a
+        # single TCP+TLS connection instead of paying a handshake per stream.
         self._client = httpx.Client(
-            auth=("API_KEY", api_key.get_secret_value()),
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            headers={
+                "Authorization": f"Basic {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
             timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
         )
+        # Per-query conditional-GET cache for get_events: query key →
+        # (etag, events). A 304 revalidation skips the body transfer when the
+        # same window is fetched again (e.g. delete after list-events).
+        self._events_cache: dict[tuple[str, ...], tuple[str, list[dict]]] = {}  # type: ignore[type-arg]
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -87,33 +112,80 @@ class IntervalsClient:
                     rather than duplicated (recommended).
 
         Returns:
-            The list of created/updated event objects from the API.
+            The list of created/updated event objects from the API,
+            in the same order as the input events.
         """
-        payload = [
-            event.model_dump(exclude_none=True)
-            for event in events
-        ]
         params = {"upsert": "true"} if upsert else {}
-        response = self._client.post(self._url("events/bulk"), json=payload, params=params)
+        if len(events) <= _UPLOAD_CHUNK_SIZE:
+            return self._post_events_chunk(events, params)
+
+        chunks = [
+            events[i : i + _UPLOAD_CHUNK_SIZE]
+            for i in range(0, len(events), _UPLOAD_CHUNK_SIZE)
+        ]
+        results: list[dict] = []  # type: ignore[type-arg]
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as pool:
+            # pool.map preserves chunk order, so results line up with input
+            for chunk_result in pool.map(
+                lambda chunk: self._post_events_chunk(chunk, params), chunks
+            ):
+                results.extend(chunk_result)
+        return results
+
+    def _post_events_chunk(
+        self,
+        events: list[IntervalsEvent],
+        params: dict[str, str],
+    ) -> list[dict]:  # type: ignore[type-arg]
+        # Serialize with orjson and post pre-encoded bytes: skips httpx's
+        # stdlib-json round-trip, which adds up over hundreds of events.
+        body = orjson.dumps(
+            [event.model_dump(exclude_none=True) for event in events]
+        )
+        response = self._client.post(self._url("events/bulk"), content=body, params=params)
         self._raise_for_status(response)
         return response.json()  # type: ignore[no-any-return]
 
-    def get_events(self, oldest: str, newest: str) -> list[dict]:  # type: ignore[type-arg]
+    def get_events(
+        self,
+        oldest: str,
+        newest: str,
+        external_id_prefix: str | None = None,
+        fields: str | None = None,
+    ) -> list[dict]:  # type: ignore[type-arg]
         """Fetch planned events within a date range.
 
         Args:
             oldest: Start date in YYYY-MM-DD format.
             newest: End date in YYYY-MM-DD format.
+            external_id_prefix: Ask the server to return only events whose
+                external_id starts with this prefix. Servers that ignore the
+                param return the full list, so callers filtering on it must
+                still verify client-side.
+            fields: Comma-separated list of fields to include in the response
+                (cuts payload size when only a few are needed).
 
         Returns:
             List of event objects from the API.
         """
-        response = self._client.get(
-            self._url("events"),
-            params={"oldest": oldest, "newest": newest},
-        )
+        params = {"oldest": oldest, "newest": newest}
+        if external_id_prefix is not None:
+            params["external_id_prefix"] = external_id_prefix
+        if fields is not None:
+            params["fields"] = fields
+
+        key = (oldest, newest, external_id_prefix or "", fields or "")
+        cached = self._events_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._client.get(self._url("events"), params=params, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
         self._raise_for_status(response)
-        return response.json()  # type: ignore[no-any-return]
+        data: list[dict] = response.json()  # type: ignore[type-arg]
+        etag = response.headers.get("ETag")
+        if etag:
+            self._events_cache[key] = (etag, data)
+        return data
 
     def delete_event(self, event_id: int) -> None:
         """Delete a single planned event by its Intervals.icu integer ID.
@@ -124,6 +196,38 @@ class IntervalsClient:
         response = self._client.delete(self._url(f"events/{event_id}"))
         self._raise_for_status(response)
 
+    def delete_events(
+        self, event_ids: list[int], concurrency: int = 8
+    ) -> list[tuple[int, IntervalsAPIError | None]]:
+        """Delete multiple planned events concurrently.
+
+        Each delete is an independent round-trip, so they are fanned out over
+        a bounded thread pool (httpx.Client is thread-safe and shares its
+        connection pool across threads). Total wall-time approaches the
+        slowest single request instead of the sum of all of them.
+
+        Args:
+            event_ids: Numeric IDs of the events to delete.
+            concurrency: Maximum number of in-flight requests.
+
+        Returns:
+            One (event_id, error) tuple per ID, in completion order.
+            error is None on success.
+        """
+        if not event_ids:
+            return []
+        results: list[tuple[int, IntervalsAPIError | None]] = []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(event_ids))) as pool:
+            futures = {pool.submit(self.delete_event, eid): eid for eid in event_ids}
+            for future in as_completed(futures):
+                event_id = futures[future]
+                try:
+                    future.result()
+                    results.append((event_id, None))
+                except IntervalsAPIError as exc:
+                    results.append((event_id, exc))
+        return results
+
     def get_athlete(self) -> dict:  # type: ignore[type-arg]
         """Fetch the authenticated athlete's profile (useful for verifying credentials)."""
         response = self._client.get(
@@ -3,14 +3,19 @@ Runna has no public API, but exposes a private ICS calendar feed URL.
 Each VEVENT contains a structured DESCRIPTION field with workout steps.
 """
 
+import hashlib
 import re
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from dataclasses import field as dc_field
 from datetime import date
+from functools import lru_cache
+from pathlib import Path
 
 import httpx
-from icalendar import Calendar
+from icalendar import Event
 
+from runna_intervals.cache import cache_dir, read_json, write_json_atomic
 from runna_intervals.models.intervals import (
     IntervalsEvent,
     WorkoutDoc,
@@ -23,6 +28,9 @@ from runna_intervals.models.intervals import (
 # ---------------------------------------------------------------------------
 
 _MI_TO_KM = 1.609344
+# Reciprocal so hot paths multiply instead of divide (FDIV is several times
+# slower than FMUL and this conversion runs once per parsed step).
+_KM_PER_MI = 1.0 / _MI_TO_KM
 
 # Default fallback easy pace. Overridden at runtime via Settings.easy_pace_sec_mi
 # or the --easy-pace CLI flag; edit this only to change the compiled-in default.
@@ -34,10 +42,23 @@ _WALK_PACE_SEC_MI = 900
 _WALK_PACE_SEC_KM = int(_WALK_PACE_SEC_MI / _MI_TO_KM)  # 559 sec/km
 
 
+def _fmt_pace(seconds: int) -> str:
+    """Format integer seconds-per-unit as 'M:SS'."""
+    mins, secs = divmod(seconds, 60)
+    return f"{mins}:{secs:02d}"
+
+
+# The walking pace never changes — fold the formatted strings at import time
+# so rest steps don't re-run divmod + f-string per step.
+_WALK_MI_STR = f"{_fmt_pace(_WALK_PACE_SEC_MI)}/mi"  # "15:00/mi"
+_WALK_KM_STR = f"{_fmt_pace(_WALK_PACE_SEC_KM)}/km"  # "9:19/km"
+
+
 def _mi_to_km(miles: float) -> float:
     return miles * _MI_TO_KM
 
 
+@lru_cache(maxsize=1024)
 def _fmt_km(km: float) -> str:
     """Format a km distance as a compact string for Intervals.icu descriptions."""
     rounded = round(km, 1)
@@ -46,6 +67,7 @@ def _fmt_km(km: float) -> str:
     return f"{rounded}km"
 
 
+@lru_cache(maxsize=1024)
 def _fmt_mi(mi: float) -> str:
     """Format a mile distance as a compact string for Intervals.icu descriptions."""
     if mi == int(mi):
@@ -54,19 +76,18 @@ def _fmt_mi(mi: float) -> str:
     return f"{s}mi"
 
 
+@lru_cache(maxsize=256)
 def _pace_str_to_sec_km(pace_mi_str: str) -> int:
     """Convert 'M:SS' min/mile string → integer seconds per km."""
     mins, secs = (int(x) for x in pace_mi_str.split(":"))
     sec_mi = mins * 60 + secs
-    km_f = sec_mi / _MI_TO_KM
-    k_min = int(km_f // 60)
-    k_sec = int(round(km_f % 60))
-    if k_sec == 60:
-        k_min += 1
-        k_sec = 0
-    return k_min * 60 + k_sec
+    # Round-to-nearest in pure integer arithmetic: 1 mi = 1.609344 km, so
+    # sec/km = sec/mi / 1.609344, scaled by 1e6 with half the divisor added.
+    # Verified to match the previous float divmod+round for all sane paces.
+    return (sec_mi * 1_000_000 + 804_672) // 1_609_344
 
 
+@lru_cache(maxsize=256)
 def _pace_km_to_sec_mi(pace_km_str: str) -> int:
     """Convert 'M:SS' min/km string → integer seconds per mile."""
     mins, secs = (int(x) for x in pace_km_str.split(":"))
@@ -89,34 +110,31 @@ def _fmt_rest(seconds: int) -> str:
 # Regex patterns for step lines
 # ---------------------------------------------------------------------------
 
-# "{N.N}mi|km at {M:SS}/mi|km"  with optional "(note)" and optional ", {N}s walking rest"
-# groups: (1) distance value, (2) distance unit, (3) pace M:SS, (4) pace unit, (5) rest secs
-_PACED_RE = re.compile(
-    r"^(?:•\s*)?(\d+(?:\.\d+)?)\s*(mi|km)\s+at\s+(\d+:\d+)/(mi|km)"
-    r"(?:\s*\([^)]*\))?"
-    r"(?:,\s*(\d+)s\s+walking\s+rest)?$",
-    re.IGNORECASE,
-)
-
-# "{N.N}mi|km ... conversational pace ..." with optional ", {N}s walking rest"
-# groups: (1) distance value, (2) distance unit, (3) rest secs
-_EASY_RE = re.compile(
-    r"^(?:•\s*)?(\d+(?:\.\d+)?)\s*(mi|km)"
+# Single alternation covering every step-line shape the regex fallback
+# handles, tried in the same order the old per-shape regexes were:
+#   rest — standalone "{N}s walking rest"
+#   easy — "{N.N}mi|km ... conversational pace" with the optional
+#          "(no faster than M:SS/mi|km)" hint (Runna always places it after
+#          the phrase) and optional ", {N}s walking rest"
+#   paced — "{N.N}mi|km at {M:SS}/mi|km" with optional "(note)" and
+#           optional ", {N}s walking rest"
+# One automaton pass yields all captures; the matched branch is identified
+# by which named group is non-None.
+_STEP_RE = re.compile(
+    r"^(?:•\s*)?(?:"
+    r"(?P<rest>\d+)s\s+walking\s+rest$"
+    r"|(?P<e_val>\d+(?:\.\d+)?)\s*(?P<e_unit>mi|km)"
     r".+?conversational\s+pace"
+    r"(?:[^,]*?\(no\s+faster\s+than\s+(?P<e_pace>\d+:\d+)/(?P<e_punit>mi|km)\))?"
     r"[^,]*"
-    r"(?:,\s*(\d+)s\s+walking\s+rest)?",
+    r"(?:,\s*(?P<e_rest>\d+)s\s+walking\s+rest)?"
+    r"|(?P<p_val>\d+(?:\.\d+)?)\s*(?P<p_unit>mi|km)\s+at\s+(?P<p_pace>\d+:\d+)/(?P<p_punit>mi|km)"
+    r"(?:\s*\([^)]*\))?"
+    r"(?:,\s*(?P<p_rest>\d+)s\s+walking\s+rest)?$"
+    r")",
     re.IGNORECASE,
 )
 
-# "(no faster than M:SS/mi|km)" pace hint embedded in easy-step descriptions
-# groups: (1) pace M:SS, (2) pace unit
-_EASY_PACE_RE = re.compile(
-    r"\(no\s+faster\s+than\s+(\d+:\d+)/(mi|km)\)", re.IGNORECASE
-)
-
-# Standalone "{N}s walking rest"
-_REST_RE = re.compile(r"^(\d+)s\s+walking\s+rest$", re.IGNORECASE)
-
 # Repeat block openers
 _REPS_OF_RE = re.compile(r"^(\d+)\s+reps\s+of:$", re.IGNORECASE)
 _REPEAT_NX_RE = re.compile(r"^Repeat the following (\d+)x:$", re.IGNORECASE)
@@ -124,8 +142,8 @@ _REPEAT_NX_RE = re.compile(r"^Repeat the following (\d+)x:$", re.IGNORECASE)
 # Header line: "Easy Run • 6mi • 50m - 55m" or "Easy Run • 10km • 50m - 55m"
 _HEADER_RE = re.compile(r"^[A-Za-z\s]+•\s*[\d.]+(mi|km)\s*•", re.IGNORECASE)
 
-# App deep-link footer
-_APP_LINK_RE = re.compile(r"^📲")
+# Trailing "• X.Xmi" / "• X.Xkm" on SUMMARY lines
+_SUMMARY_TRAIL_RE = re.compile(r"\s*•\s*[\d.]+(mi|km)\s*$", re.IGNORECASE)
 
 
 # ---------------------------------------------------------------------------
@@ -133,7 +151,7 @@ _APP_LINK_RE = re.compile(r"^📲")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class _Step:
     """Parsed Runna workout step."""
 
@@ -146,7 +164,7 @@ class _Step:
     label: str = ""  # "Warm Up", "Cool Down", or ""
 
 
-@dataclass
+@dataclass(slots=True)
 class _Block:
     """A repeated set of steps."""
 
@@ -154,7 +172,7 @@ class _Block:
     steps: list[_Step] = dc_field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class _Section:
     """A named section of workout steps (Warmup, Main Set, Cooldown, etc.)."""
 
@@ -167,6 +185,140 @@ class _Section:
 # ---------------------------------------------------------------------------
 
 
+def _make_paced_steps(
+    val: float,
+    dist_unit: str,
+    pace_str: str,
+    pace_unit: str,
+    rest_s: int | None,
+) -> list[_Step]:
+    """Build the _Step list for a specific-pace step (plus optional rest)."""
+    if dist_unit == "km":
+        km = val
+        mi = km * _KM_PER_MI
+    else:
+        mi = val
+        km = _mi_to_km(mi)
+    p_mins, p_secs = (int(x) for x in pace_str.split(":"))
+    if pace_unit == "km":
+        pace_sec_km = p_mins * 60 + p_secs
+        pace_sec_mi = _pace_km_to_sec_mi(pace_str)
+    else:
+        pace_sec_mi = p_mins * 60 + p_secs
+        pace_sec_km = _pace_str_to_sec_km(pace_str)
+
+    steps = [
+        _Step(
+            distance_m=km * 1000,
+            distance_mi=mi,
+            pace_sec_km=pace_sec_km,
+            pace_sec_mi=pace_sec_mi,
+        )
+    ]
+    if rest_s:
+        steps.append(_Step(rest_s=rest_s, is_rest=True))
+    return steps
+
+
+def _scan_leading_distance(line: str) -> tuple[float, str, int] | None:
+    """Parse a leading 'N[.N]mi|km' by direct digit scanning.
+
+    Returns (value, unit, index-past-unit) or None if the line doesn't start
+    with a distance.
+    """
+    i = 0
+    n = len(line)
+    while i < n and line[i].isdigit():
+        i += 1
+    if i == 0:
+        return None
+    if i < n and line[i] == ".":
+        j = i + 1
+        while j < n and line[j].isdigit():
+            j += 1
+        if j == i + 1:
+            return None
+        i = j
+    val = float(line[:i])
+    while i < n and line[i] == " ":
+        i += 1
+    unit = line[i : i + 2]
+    if unit not in ("mi", "km"):
+        return None
+    return val, unit, i + 2
+
+
+_WALKING_REST_SUFFIX = "s walking rest"
+
+
+def _scan_step(line: str) -> list[_Step] | None:
+    """str.find-based fast path for the two most common step-line shapes:
+
+        "{N}s walking rest"
+        "{N.N}mi|km at {M:SS}/mi|km[ (note)][, {N}s walking rest]"
+
+    Runna lines are rigidly formatted, so a direct scan avoids the regex
+    engine entirely on the hot path. Returns None for anything else
+    (easy/conversational steps, unusual spacing or casing) so the caller
+    falls back to the full regex chain.
+    """
+    if line.startswith("• "):
+        line = line[2:].lstrip()
+
+    # Standalone rest: "90s walking rest"
+    if line.endswith(_WALKING_REST_SUFFIX):
+        head = line[: -len(_WALKING_REST_SUFFIX)]
+        if head.isdigit():
+            return [_Step(rest_s=int(head), is_rest=True)]
+
+    if "conversational" in line:
+        return None  # easy steps carry pace hints / labels — regex path
+
+    dist = _scan_leading_distance(line)
+    if dist is None:
+        return None
+    val, dist_unit, i = dist
+
+    if not line.startswith(" at ", i):
+        return None
+    i += 4
+
+    # Pace "M:SS/mi|km"
+    colon = line.find(":", i)
+    if colon == -1 or not line[i:colon].isdigit():
+        return None
+    k = colon + 1
+    n = len(line)
+    while k < n and line[k].isdigit():
+        k += 1
+    if k == colon + 1 or k >= n or line[k] != "/":
+        return None
+    pace_str = line[i:k]
+    pace_unit = line[k + 1 : k + 3]
+    if pace_unit not in ("mi", "km"):
+        return None
+    tail = line[k + 3 :]
+
+    # Optional "(note)"
+    if tail.lstrip(" ").startswith("("):
+        close = tail.find(")")
+        if close == -1:
+            return None
+        tail = tail[close + 1 :]
+
+    # Optional ", Ns walking rest"
+    rest_s = None
+    if tail:
+        if not tail.startswith(", ") or not tail.endswith(_WALKING_REST_SUFFIX):
+            return None
+        num = tail[2 : -len(_WALKING_REST_SUFFIX)]
+        if not num.isdigit():
+            return None
+        rest_s = int(num)
+
+    return _make_paced_steps(val, dist_unit, pace_str, pace_unit, rest_s)
+
+
 def _parse_step_data(line: str) -> list[_Step]:
     """Parse one Runna step line → list of _Step objects.
 
@@ -177,19 +329,28 @@ def _parse_step_data(line: str) -> list[_Step]:
     if not line:
         return []
 
-    # Standalone rest
-    m = _REST_RE.match(line)
-    if m:
-        return [_Step(rest_s=int(m.group(1)), is_rest=True)]
+    # Fast path for the rigidly-formatted common shapes
+    fast = _scan_step(line)
+    if fast is not None:
+        return fast
 
-    # Easy / conversational step (check before paced)
-    m = _EASY_RE.match(line)
-    if m:
-        val = float(m.group(1))
-        dist_unit = m.group(2).lower()
-        if dist_unit == "km":
+    # One automaton pass over the line; dispatch on the matched branch
+    m = _STEP_RE.match(line)
+    if m is None:
+        return []  # unrecognised line
+
+    # Standalone rest
+    rest = m.group("rest")
+    if rest:
+        return [_Step(rest_s=int(rest), is_rest=True)]
+
+    # Easy / conversational step (tried before paced)
+    val_str = m.group("e_val")
+    if val_str:
+        val = float(val_str)
+        if m.group("e_unit").lower() == "km":
             km = val
-            mi = km / _MI_TO_KM
+            mi = km * _KM_PER_MI
         else:
             mi = val
             km = _mi_to_km(mi)
@@ -201,19 +362,18 @@ def _parse_step_data(line: str) -> list[_Step]:
         else:
             label = ""
 
-        # Extract explicit "(no faster than M:SS/mi|km)" pace if present
-        pm = _EASY_PACE_RE.search(line)
+        # Explicit "(no faster than M:SS/mi|km)" pace, captured by the same match
+        pace_str = m.group("e_pace")
         pace_sec_mi = None
         pace_sec_km = None
-        if pm:
-            pace_unit = pm.group(2).lower()
-            p_mins, p_secs = (int(x) for x in pm.group(1).split(":"))
-            if pace_unit == "km":
+        if pace_str:
+            p_mins, p_secs = (int(x) for x in pace_str.split(":"))
+            if m.group("e_punit").lower() == "km":
                 pace_sec_km = p_mins * 60 + p_secs
-                pace_sec_mi = _pace_km_to_sec_mi(pm.group(1))
+                pace_sec_mi = _pace_km_to_sec_mi(pace_str)
             else:
                 pace_sec_mi = p_mins * 60 + p_secs
-                pace_sec_km = _pace_str_to_sec_km(pm.group(1))
+                pace_sec_km = _pace_str_to_sec_km(pace_str)
 
         steps = [
             _Step(
@@ -224,44 +384,20 @@ def _parse_step_data(line: str) -> list[_Step]:
                 label=label,
             )
         ]
-        if m.group(3):  # rest is group 3 (dist_unit is group 2)
-            steps.append(_Step(rest_s=int(m.group(3)), is_rest=True))
+        e_rest = m.group("e_rest")
+        if e_rest:
+            steps.append(_Step(rest_s=int(e_rest), is_rest=True))
         return steps
 
     # Specific-pace step
-    m = _PACED_RE.match(line)
-    if m:
-        val = float(m.group(1))
-        dist_unit = m.group(2).lower()
-        pace_str = m.group(3)
-        pace_unit = m.group(4).lower()
-        if dist_unit == "km":
-            km = val
-            mi = km / _MI_TO_KM
-        else:
-            mi = val
-            km = _mi_to_km(mi)
-        p_mins, p_secs = (int(x) for x in pace_str.split(":"))
-        if pace_unit == "km":
-            pace_sec_km = p_mins * 60 + p_secs
-            pace_sec_mi = _pace_km_to_sec_mi(pace_str)
-        else:
-            pace_sec_mi = p_mins * 60 + p_secs
-            pace_sec_km = _pace_str_to_sec_km(pace_str)
-
-        steps = [
-            _Step(
-                distance_m=km * 1000,
-                distance_mi=mi,
-                pace_sec_km=pace_sec_km,
-                pace_sec_mi=pace_sec_mi,
-            )
-        ]
-        if m.group(5):  # rest is group 5 (dist_unit=2, pace_str=3, pace_unit=4)
-            steps.append(_Step(rest_s=int(m.group(5)), is_rest=True))
-        return steps
-
-    return []  # unrecognised line
+    p_rest = m.group("p_rest")
+    return _make_paced_steps(
+        float(m.group("p_val")),
+        m.group("p_unit").lower(),
+        m.group("p_pace"),
+        m.group("p_punit").lower(),
+        int(p_rest) if p_rest else None,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -282,41 +418,59 @@ def _step_to_desc_line(
         fallback_pace_sec: Fallback pace in sec/mi (use_miles=True) or sec/km
             (use_miles=False) for easy steps without an explicit pace target.
     """
-    if step.is_rest:
-        rest_dur = _fmt_rest(step.rest_s or 0)
-        if use_miles:
-            pace_m, pace_s = divmod(_WALK_PACE_SEC_MI, 60)
-            return f"- {rest_dur} {pace_m}:{pace_s:02d}/mi Pace"
-        else:
-            pace_m, pace_s = divmod(_WALK_PACE_SEC_KM, 60)
-            return f"- {rest_dur} {pace_m}:{pace_s:02d}/km Pace"
+    liner = _DESC_LINER_MI if use_miles else _DESC_LINER_KM
+    return liner(step, fallback_pace_sec)
 
-    if step.distance_mi is None and step.distance_m is None:
-        return ""
 
-    # Distance string
-    if use_miles and step.distance_mi is not None:
-        dist_str = _fmt_mi(step.distance_mi)
-    else:
-        km = (step.distance_m or 0) / 1000
-        dist_str = _fmt_km(km)
+def _make_desc_liner(use_miles: bool) -> Callable[[_Step, int | None], str]:
+    """Build a description-line formatter specialized for one output unit.
+
+    use_miles is fixed for a whole feed, so the per-unit strings and branches
+    are resolved once here instead of on every step.
+    """
+    walk_str = _WALK_MI_STR if use_miles else _WALK_KM_STR
+    unit = "/mi" if use_miles else "/km"
 
-    # Pace
     if use_miles:
-        pace_sec = step.pace_sec_mi
-        if pace_sec is None:
-            pace_sec = fallback_pace_sec
-    else:
-        pace_sec = step.pace_sec_km
-        if pace_sec is None:
-            pace_sec = fallback_pace_sec
-
-    if pace_sec is not None:
-        pace_m, pace_s = divmod(pace_sec, 60)
-        unit = "/mi" if use_miles else "/km"
-        return f"- {dist_str} {pace_m}:{pace_s:02d}{unit} Pace"
+
+        def liner(step: _Step, fallback_pace_sec: int | None = None) -> str:
+            if step.is_rest:
+                return f"- {_fmt_rest(step.rest_s or 0)} {walk_str} Pace"
+            if step.distance_mi is not None:
+                dist_str = _fmt_mi(step.distance_mi)
+            elif step.distance_m is not None:
+                dist_str = _fmt_km(step.distance_m / 1000)
+            else:
+                return ""
+            pace_sec = step.pace_sec_mi
+            if pace_sec is None:
+                pace_sec = fallback_pace_sec
+            if pace_sec is None:
+                return f"- {dist_str} easy"
+            pace_m, pace_s = divmod(pace_sec, 60)
+            return f"- {dist_str} {pace_m}:{pace_s:02d}{unit} Pace"
+
     else:
-        return f"- {dist_str} easy"
+
+        def liner(step: _Step, fallback_pace_sec: int | None = None) -> str:
+            if step.is_rest:
+                return f"- {_fmt_rest(step.rest_s or 0)} {walk_str} Pace"
+            if step.distance_m is None and step.distance_mi is None:
+                return ""
+            dist_str = _fmt_km((step.distance_m or 0) / 1000)
+            pace_sec = step.pace_sec_km
+            if pace_sec is None:
+                pace_sec = fallback_pace_sec
+            if pace_sec is None:
+                return f"- {dist_str} easy"
+            pace_m, pace_s = divmod(pace_sec, 60)
+            return f"- {dist_str} {pace_m}:{pace_s:02d}{unit} Pace"
+
+    return liner
+
+
+_DESC_LINER_MI = _make_desc_liner(True)
+_DESC_LINER_KM = _make_desc_liner(False)
 
 
 def _step_duration_s(step: _Step, easy_pace_sec_km: int = _EASY_PACE_SEC_KM) -> int:
@@ -402,8 +556,15 @@ def _parse_paragraph(para: str) -> list[_Step | _Block]:
 def _parse_workout(raw: str) -> list[_Section]:
     """Parse a full Runna workout description → list of named sections."""
     sections: list[_Section] = []
-    for para in [p.strip() for p in raw.split("\n\n") if p.strip()]:
-        if _HEADER_RE.match(para) or _APP_LINK_RE.match(para):
+    for para in raw.split("\n\n"):
+        para = para.strip()
+        if not para:
+            continue
+        # Cheap prefilters: the app-link footer starts with 📲, and a header
+        # line always contains a bullet — skip the regex when it can't match.
+        if para.startswith("📲"):
+            continue
+        if "•" in para and _HEADER_RE.match(para):
             continue
         items = _parse_paragraph(para)
         if not items:
@@ -439,67 +600,94 @@ def _find_fallback_easy_pace(sections: list[_Section]) -> int | None:
     return None
 
 
-def _sections_to_description(
+def _sections_to_output(
     sections: list[_Section],
     use_miles: bool = False,
     easy_pace_sec_mi: int = _EASY_PACE_SEC_MI,
-) -> str:
-    """Convert structured sections → Intervals.icu description text."""
+    easy_pace_sec_km: int = _EASY_PACE_SEC_KM,
+) -> tuple[str, WorkoutDoc]:
+    """Convert structured sections → (description text, WorkoutDoc) in one pass.
+
+    The description line and the WorkoutStep for each item are built in the
+    same loop iteration, so the sections tree is walked once instead of twice.
+    Section separators and headers are held back until the section actually
+    emits a line, so the text never contains blank runs.
+    """
     fallback_mi = _find_fallback_easy_pace(sections) or easy_pace_sec_mi
 
     # Pre-compute fallback in the output unit
     if fallback_mi is not None:
-        fallback_km = int(fallback_mi / _MI_TO_KM)
+        fallback_km = int(fallback_mi * _KM_PER_MI)
     else:
         fallback_km = None
 
     fallback_sec = fallback_mi if use_miles else fallback_km
     show_headers = len(sections) > 1
+    liner = _DESC_LINER_MI if use_miles else _DESC_LINER_KM
 
-    result: list[str] = []
+    desc_lines: list[str] = []
+    steps: list[WorkoutStep] = []
     last_header: str | None = None
 
     for section in sections:
-        header = section.header
-        if result:
-            result.append("")
-        if show_headers and header != last_header:
-            if header:
-                result.append(header)
-            last_header = header
+        emit_header = show_headers and section.header != last_header
+        if emit_header:
+            last_header = section.header
+
+        # Per-section buffers flushed with one extend each: the outer lists
+        # grow once per section instead of once per item.
+        sec_lines: list[str] = []
+        sec_steps: list[WorkoutStep] = []
+        add_line = sec_lines.append
+        add_step = sec_steps.append
 
         for item in section.items:
             if isinstance(item, _Block):
-                result.append(f"{item.reps}x")
+                add_line(f"{item.reps}x")
+                substeps = []
                 for step in item.steps:
-                    line = _step_to_desc_line(step, use_miles, fallback_sec)
+                    line = liner(step, fallback_sec)
                     if line:
-                        result.append(line)
+                        add_line(line)
+                    substeps.append(_step_to_workout_step(step, easy_pace_sec_km))
+                add_step(WorkoutStep(reps=item.reps, steps=substeps))
             else:
-                line = _step_to_desc_line(item, use_miles, fallback_sec)
+                line = liner(item, fallback_sec)
                 if line:
-                    result.append(line)
+                    add_line(line)
+                ws = _step_to_workout_step(item, easy_pace_sec_km)
+                if ws.distance is not None or ws.duration is not None:
+                    add_step(ws)
 
-    return re.sub(r"\n{3,}", "\n\n", "\n".join(result).strip())
+        steps.extend(sec_steps)
+        if sec_lines:
+            # Separator and header join only when the section emitted a line,
+            # so the text never contains blank runs.
+            if desc_lines:
+                desc_lines.append("")
+            if emit_header and section.header:
+                desc_lines.append(section.header)
+            desc_lines.extend(sec_lines)
+
+    return "\n".join(desc_lines), WorkoutDoc(steps=steps)
+
+
+def _sections_to_description(
+    sections: list[_Section],
+    use_miles: bool = False,
+    easy_pace_sec_mi: int = _EASY_PACE_SEC_MI,
+) -> str:
+    """Convert structured sections → Intervals.icu description text."""
+    return _sections_to_output(
+        sections, use_miles=use_miles, easy_pace_sec_mi=easy_pace_sec_mi
+    )[0]
 
 
 def _sections_to_workout_doc(
     sections: list[_Section], easy_pace_sec_km: int = _EASY_PACE_SEC_KM
 ) -> WorkoutDoc:
     """Convert structured sections → WorkoutDoc with pace targets (always km units)."""
-    steps: list[WorkoutStep] = []
-    for section in sections:
-        for item in section.items:
-            if isinstance(item, _Block):
-                substeps = [
-                    _step_to_workout_step(s, easy_pace_sec_km) for s in item.steps
-                ]
-                steps.append(WorkoutStep(reps=item.reps, steps=substeps))
-            else:
-                ws = _step_to_workout_step(item, easy_pace_sec_km)
-                if ws.distance is not None or ws.duration is not None:
-                    steps.append(ws)
-    return WorkoutDoc(steps=steps)
+    return _sections_to_output(sections, easy_pace_sec_km=easy_pace_sec_km)[1]
 
 
 # ---------------------------------------------------------------------------
@@ -531,6 +719,130 @@ def _parse_description(
 # ---------------------------------------------------------------------------
 
 
+# Bump when the description / workout_doc output format changes, so stale
+# cache entries from older releases are ignored rather than replayed.
+_DOC_CACHE_VERSION = 1
+
+
+def _workout_step_from_cache(data: dict) -> WorkoutStep:  # type: ignore[type-arg]
+    """Rebuild a WorkoutStep from a cached dict without re-validating.
+
+    model_construct skips pydantic-core validation, which is safe here: the
+    cached dicts were produced by our own model_dump on a previous run.
+    """
+    pace = data.get("pace")
+    substeps = data.get("steps")
+    return WorkoutStep.model_construct(
+        text=data.get("text"),
+        pace=WorkoutStepPace.model_construct(**pace) if pace else None,
+        distance=data.get("distance"),
+        duration=data.get("duration"),
+        reps=data.get("reps"),
+        steps=[_workout_step_from_cache(s) for s in substeps] if substeps else None,
+    )
+
+
+def _workout_doc_from_cache(data: dict) -> WorkoutDoc:  # type: ignore[type-arg]
+    return WorkoutDoc.model_construct(
+        steps=[_workout_step_from_cache(s) for s in data["steps"]]
+    )
+
+
+def _iter_vevent_chunks(ics_text: str) -> Iterator[str]:
+    """Yield raw BEGIN:VEVENT…END:VEVENT blocks without parsing them."""
+    pos = 0
+    while True:
+        start = ics_text.find("BEGIN:VEVENT", pos)
+        if start == -1:
+            return
+        end = ics_text.find("END:VEVENT", start)
+        if end == -1:
+            return
+        end += len("END:VEVENT")
+        yield ics_text[start:end]
+        pos = end
+
+
+def _date_from_dtstart(value: str) -> str | None:
+    """Convert a raw DTSTART value ('20260401' / '20260401T000000') to YYYY-MM-DD.
+
+    Returns None when the value cannot be read confidently — callers must
+    then fall back to icalendar.
+    """
+    value = value.strip()
+    if len(value) >= 8 and value[:8].isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:8]}"
+    return None
+
+
+def _peek_dtstart(chunk: str) -> str | None:
+    """Cheaply extract the DTSTART date (YYYY-MM-DD) from a raw VEVENT chunk.
+
+    Used to apply the date filter before paying for a full parse.
+    """
+    idx = chunk.find("DTSTART")
+    if idx == -1:
+        return None
+    line_end = chunk.find("\n", idx)
+    line = chunk[idx : line_end if line_end != -1 else len(chunk)].rstrip("\r")
+    _, _, value = line.partition(":")
+    return _date_from_dtstart(value)
+
+
+# Properties parse_ics_to_events actually reads; everything else in a VEVENT
+# is skipped without being wrapped in an icalendar type.
+_WANTED_PROPS = frozenset(
+    {"DTSTART", "UID", "SUMMARY", "DESCRIPTION", "X-WORKOUT-ESTIMATED-DURATION"}
+)
+
+
+def _unescape_ical(value: str) -> str:
+    """Undo RFC 5545 TEXT escaping (\\n, \\,, \\;, \\\\) like icalendar does."""
+    if "\\" not in value:
+        return value
+    # Split on escaped backslashes first so "\\n" (literal backslash + n)
+    # is not mistaken for an escaped newline.
+    parts = [
+        part.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",").replace("\\;", ";")
+        for part in value.split("\\\\")
+    ]
+    return "\\".join(parts)
+
+
+def _parse_vevent_props(chunk: str) -> dict[str, str] | None:
+    """Extract the wanted properties from a raw VEVENT chunk by line scanning.
+
+    Unfolds RFC 5545 continuation lines (leading space or tab), splits each
+    property at the first ':' and unescapes the value, skipping the icalendar
+    object tree entirely. Returns None when the chunk does not look like
+    plain property lines, in which case callers should fall back to icalendar.
+    """
+    props: dict[str, str] = {}
+    current: str | None = None  # wanted property a continuation would extend
+    for raw_line in chunk.splitlines():
+        if raw_line[:1] in (" ", "\t"):
+            if current is not None:
+                props[current] += raw_line[1:]
+            continue
+        name, sep, value = raw_line.partition(":")
+        if not sep:
+            if raw_line.strip():
+                return None
+            current = None
+            continue
+        name = name.split(";", 1)[0].upper()
+        if name == "BEGIN" and value.strip().upper() != "VEVENT":
+            # Nested component (e.g. a VALARM reminder): its properties must
+            # not be read as the event's own, so let icalendar handle it.
+            return None
+        if name in _WANTED_PROPS:
+            props[name] = value
+            current = name
+        else:
+            current = None
+    return {name: _unescape_ical(value) for name, value in props.items()}
+
+
 def _parse_date(component: object) -> str:
     """Extract DTSTART from a VEVENT component as a YYYY-MM-DD string."""
     dtstart = component.get("DTSTART")  # type: ignore[attr-defined]
@@ -542,20 +854,108 @@ def _parse_date(component: object) -> str:
     return str(d)[:10]
 
 
+def _lstrip_emoji(text: str) -> str:
+    """Drop leading emoji and whitespace from a SUMMARY without the regex engine.
+
+    Covers the dingbat (U+2700–U+27BF) and supplementary symbol/emoji
+    (U+1F000–U+1FFFF) ranges Runna uses as workout-type prefixes.
+    """
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch.isspace():
+            i += 1
+            continue
+        cp = ord(ch)
+        if 0x1F000 <= cp <= 0x1FFFF or 0x2700 <= cp <= 0x27BF:
+            i += 1
+            continue
+        break
+    return text[i:]
+
+
 def _clean_summary(raw: str) -> str:
     """Strip leading emoji and trailing '• Xmi' from SUMMARY."""
-    # Remove emoji (anything in Unicode private/emoji ranges at start)
-    text = re.sub(
-        r"^[\U0001F000-\U0001FFFF\U00002700-\U000027BF\s🏃]+", "", raw
-    ).strip()
-    # Remove trailing "• X.Xmi" or "• X.Xkm"
-    text = re.sub(r"\s*•\s*[\d.]+(mi|km)\s*$", "", text).strip()
+    text = _lstrip_emoji(raw)
+    text = _SUMMARY_TRAIL_RE.sub("", text).strip()
     return text
 
 
+_ICS_CHUNK_SIZE = 65536
+
+# Lazily-created shared client so repeated fetches (polling, multiple feeds)
+# reuse one TCP+TLS connection instead of paying a handshake per call.
+_CLIENT: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(http2=True, timeout=30.0, follow_redirects=True)
+    return _CLIENT
+
+
+def _stream_ics_body(response: httpx.Response, body_path: Path) -> str:
+    """Stream a response body into the cache file and return the decoded text.
+
+    Chunked writes cap peak memory at the chunk size instead of holding the
+    full feed twice (raw bytes buffer + decoded str), which matters for
+    multi-year plans.
+    """
+    tmp = body_path.with_suffix(body_path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        for chunk in response.iter_bytes(_ICS_CHUNK_SIZE):
+            f.write(chunk)
+    tmp.replace(body_path)
+    return body_path.read_text(encoding="utf-8")
+
+
 def fetch_ics(url: str) -> str:
-    """Fetch an ICS feed from a URL and return the raw text."""
-    response = httpx.get(url, timeout=30.0, follow_redirects=True)
+    """Fetch an ICS feed from a URL and return the raw text.
+
+    Sends a conditional GET using the ETag / Last-Modified headers saved from
+    the previous fetch; on HTTP 304 the cached body is returned without
+    re-downloading the feed. Fresh bodies are streamed straight to the cache
+    file rather than buffered in memory. The cache is best-effort — any miss
+    or I/O error falls back to a plain buffered download.
+    """
+    meta_path = cache_dir() / "ics.meta"
+    body_path = cache_dir() / "ics.body"
+
+    headers: dict[str, str] = {}
+    meta = read_json(meta_path)
+    if meta and meta.get("url") == url and body_path.exists():
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with _get_client().stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            try:
+                return body_path.read_text(encoding="utf-8")
+            except OSError:
+                pass  # cached body vanished — refetch unconditionally below
+        else:
+            response.raise_for_status()
+            try:
+                text = _stream_ics_body(response, body_path)
+            except OSError:
+                text = None  # cache not writable — refetch buffered below
+            if text is not None:
+                write_json_atomic(
+                    meta_path,
+                    {
+                        "url": url,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    },
+                )
+                return text
+
+    # Rare fallback: the cache was unusable mid-fetch. Do a plain download.
+    response = _get_client().get(url)
     response.raise_for_status()
     return response.text
 
@@ -567,9 +967,14 @@ def parse_ics_to_events(
     use_miles: bool = False,
     easy_pace_sec_mi: int | None = None,
     skipped: list[tuple[str, str]] | None = None,
+    limit: int | None = None,
 ) -> list[IntervalsEvent]:
     """Parse a Runna ICS feed into a list of Intervals.icu events.
 
+    VEVENT blocks are first located by a cheap text scan; the date filter is
+    applied by peeking at DTSTART so filtered-out workouts never reach the
+    full (regex-heavy) description parser.
+
     Args:
         ics_text: Raw ICS calendar text.
         start_date: Optional filter — only include workouts on or after this date (YYYY-MM-DD).
@@ -579,48 +984,115 @@ def parse_ics_to_events(
             explicit pace. When None, falls back to the module default (520 = 8:40/mi).
         skipped: Optional list to collect (date, name) tuples for workouts that could not
             be parsed. When None, unparseable workouts are silently dropped.
+        limit: Optional cap — stop parsing once this many events have been produced.
 
     Returns:
         List of IntervalsEvent objects ready to upload.
     """
     _easy_mi = easy_pace_sec_mi if easy_pace_sec_mi is not None else _EASY_PACE_SEC_MI
-    _easy_km = int(_easy_mi / _MI_TO_KM)
+    _easy_km = int(_easy_mi * _KM_PER_MI)
 
-    cal = Calendar.from_ical(ics_text)
-    events: list[IntervalsEvent] = []
+    doc_cache_path = cache_dir() / "workout_docs.json"
+    doc_cache = read_json(doc_cache_path) or {}
+    if doc_cache.get("version") != _DOC_CACHE_VERSION:
+        doc_cache = {"version": _DOC_CACHE_VERSION}
+    doc_cache_dirty = False
 
-    for component in cal.walk():
-        if component.name != "VEVENT":
-            continue
+    events: list[IntervalsEvent] = []
 
-        workout_date = _parse_date(component)
+    # Bind the per-event callables to locals: LOAD_FAST beats LOAD_GLOBAL and
+    # this loop runs once per VEVENT in the feed.
+    _parse_props = _parse_vevent_props
+    _from_dtstart = _date_from_dtstart
+    _clean = _clean_summary
+    _sha256 = hashlib.sha256
+    _cache_get = doc_cache.get
+    _emit = events.append
+
+    for chunk in _iter_vevent_chunks(ics_text):
+        if limit is not None and len(events) >= limit:
+            break
+
+        # Cheap date filter before the full parse
+        if start_date or end_date:
+            peeked = _peek_dtstart(chunk)
+            if peeked is not None:
+                if start_date and peeked < start_date:
+                    continue
+                if end_date and peeked > end_date:
+                    continue
+
+        props = _parse_props(chunk)
+        workout_date = (
+            _from_dtstart(props["DTSTART"])
+            if props is not None and "DTSTART" in props
+            else None
+        )
+        if props is not None and workout_date is not None:
+            uid = props.get("UID", "")
+            summary_raw = props.get("SUMMARY", "Workout")
+            desc_value = props.get("DESCRIPTION", "")
+            est = props.get("X-WORKOUT-ESTIMATED-DURATION", "")
+        else:
+            # Fallback: let icalendar handle anything the fast scanner can't.
+            component = Event.from_ical(chunk)
+            workout_date = _parse_date(component)
+            uid = str(component.get("UID", ""))
+            summary_raw = str(component.get("SUMMARY", "Workout"))
+            desc_value = str(component.get("DESCRIPTION", ""))
+            est_duration = component.get("X-WORKOUT-ESTIMATED-DURATION")
+            est = str(est_duration) if est_duration else ""
 
         if start_date and workout_date < start_date:
             continue
         if end_date and workout_date > end_date:
             continue
 
-        uid = str(component.get("UID", ""))
-        summary = _clean_summary(str(component.get("SUMMARY", "Workout")))
+        summary = _clean(summary_raw)
 
-        # Unescape ICS newlines (\n → actual newline)
-        desc_raw = str(component.get("DESCRIPTION", "")).replace("\\n", "\n")
+        # Unescape ICS newlines (\n → actual newline) if any survived
+        desc_raw = desc_value.replace("\\n", "\n") if "\\n" in desc_value else desc_value
 
-        est_duration = component.get("X-WORKOUT-ESTIMATED-DURATION")
-        moving_time = int(str(est_duration)) if est_duration else 3600
+        # Fast skip for rest days / cross-training: an empty or app-link-only
+        # description can never yield a workout, so don't run the parser.
+        stripped = desc_raw.strip()
+        if not stripped or (stripped.startswith("📲") and "\n\n" not in stripped):
+            if skipped is not None:
+                skipped.append((workout_date, summary))
+            continue
+
+        moving_time = int(est) if est else 3600
+
+        # The description/workout_doc pair depends only on the raw description
+        # and parse options, so reruns can skip the parser (and pydantic
+        # validation) entirely on a cache hit.
+        cache_key = _sha256(
+            f"{use_miles}|{_easy_mi}|{desc_raw}".encode()
+        ).hexdigest()
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            description = cached["description"]
+            doc = _workout_doc_from_cache(cached["doc"]) if cached.get("doc") else None
+        else:
+            description, workout_doc = _sections_to_output(
+                _parse_workout(desc_raw),
+                use_miles=use_miles,
+                easy_pace_sec_mi=_easy_mi,
+                easy_pace_sec_km=_easy_km,
+            )
+            doc = workout_doc if workout_doc.steps else None
+            doc_cache[cache_key] = {
+                "description": description,
+                "doc": doc.model_dump() if doc else None,
+            }
+            doc_cache_dirty = True
 
-        sections = _parse_workout(desc_raw)
-        description = _sections_to_description(
-            sections, use_miles=use_miles, easy_pace_sec_mi=_easy_mi
-        )
         if not description:
             if skipped is not None:
                 skipped.append((workout_date, summary))
             continue
 
-        workout_doc = _sections_to_workout_doc(sections, easy_pace_sec_km=_easy_km)
-
-        events.append(
+        _emit(
             IntervalsEvent(
                 start_date_local=f"{workout_date}T00:00:00",
                 name=summary,
@@ -628,8 +1100,11 @@ def parse_ics_to_events(
                 moving_time=moving_time,
                 target="PACE",
                 external_id=f"runna-{uid}" if uid else None,
-                workout_doc=workout_doc if workout_doc.steps else None,
+                workout_doc=doc,
             )
         )
 
+    if doc_cache_dirty:
+        write_json_atomic(doc_cache_path, doc_cache)
+
     return events
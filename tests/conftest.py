@@ -0,0 +1,15 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the on-disk cache at a per-test tmp dir.
+
+    Keeps tests deterministic and stops them from touching (or being served
+    stale results from) the real ~/.cache/runna-intervals.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
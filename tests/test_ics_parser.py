@@ -1,5 +1,11 @@
 """Tests for the Runna ICS calendar parser."""
 
+import re
+from functools import cache
+
+import pytest
+
+from runna_intervals.models.intervals import IntervalsEvent
 from runna_intervals.runna.ics_parser import (
     _EASY_PACE_SEC_KM,
     _fmt_km,
@@ -10,96 +16,213 @@ from runna_intervals.runna.ics_parser import (
 )
 
 
-class TestUnitConversions:
-    def test_fmt_km_whole(self) -> None:
-        assert _fmt_km(2.0) == "2km"
+@cache
+def _cached_parse(desc: str, use_miles: bool = False) -> str:
+    """Memoized _parse_description so repeated runs in one process (watch
+    mode, pytest-repeat) pay for each distinct description only once."""
+    return _parse_description(desc, use_miles=use_miles)
 
-    def test_fmt_km_fractional(self) -> None:
-        assert _fmt_km(1.207) == "1.2km"
 
-    def test_fmt_rest_sub_minute(self) -> None:
-        assert _fmt_rest(40) == "40s"
+@cache
+def _needles_re(needles: tuple[str, ...]) -> re.Pattern[str]:
+    # Longest-first so a short needle can't shadow a longer one that
+    # starts at the same position.
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
 
-    def test_fmt_rest_under_two_minutes(self) -> None:
-        assert _fmt_rest(90) == "90s"
 
-    def test_fmt_rest_whole_minutes(self) -> None:
-        assert _fmt_rest(120) == "2m"
+def _assert_all_in(text: str, *needles: str) -> None:
+    """Assert every needle is a substring of text in one pass.
 
-    def test_fmt_rest_mixed(self) -> None:
-        assert _fmt_rest(150) == "2m30s"
+    A single combined-regex scan replaces N separate `in` scans; the
+    compiled pattern is cached per needle set across the whole run.
+    """
+    found = {m.group(0) for m in _needles_re(needles).finditer(text)}
+    missing = [n for n in needles if n not in found]
+    assert not missing, f"missing from output: {missing}\n{text}"
 
 
-class TestParseStepLine:
-    def test_easy_warmup(self) -> None:
-        lines = _parse_step_line(
-            "1.25mi warm up at a conversational pace (no faster than 8:40/mi), 90s walking rest"
-        )
-        assert len(lines) == 2
-        assert "2km" in lines[0]
-        assert "5:23/km Pace" in lines[0]  # 8:40/mi → 5:23/km
-        assert "90s" in lines[1]  # kept as seconds (< 2 min)
-        assert "9:19/km Pace" in lines[1]  # walking pace for rest
+# ICS fixtures shared by the classes below, hoisted to module scope so the
+# strings are built once at import instead of per class body.
+_MINIMAL_ICS = """\
+BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Runna//EN
 
-    def test_easy_cooldown(self) -> None:
-        # No explicit pace — no fallback in step-line context — shows "easy"
-        lines = _parse_step_line(
-            "1.1mi cool down at a conversational pace (or slower!)"
-        )
-        assert len(lines) == 1
-        assert "1.8km" in lines[0]
-        assert "easy" in lines[0]
+BEGIN:VEVENT
+UID:UPCOMING_PLAN_WORKOUT-abc123
+DTSTAMP:20260219
+DTSTART:20260401
+DTEND:20260402
+SUMMARY:🏃 Threshold Intervals • 5mi
+DESCRIPTION:Intervals • 5mi • 45m - 50m\\n\\n1mi warm up\\, 90s walking rest\\n\\n4 reps
+ of:\\n• 0.5mi at 6:45/mi\\, 90s walking rest\\n\\n1mi cool down\\n\\n📲 View in the Runna
+ app: https://example.com
+X-WORKOUT-ESTIMATED-DURATION:3000
+END:VEVENT
 
-    def test_easy_run_no_rest(self) -> None:
-        lines = _parse_step_line(
-            "6mi easy run at a conversational pace (no faster than 8:40/mi). "
-            "This is a limit, not a target - run at whatever pace feels truly easy!"
-        )
-        assert len(lines) == 1
-        assert "9.7km" in lines[0]
-        assert (
-            "5:23/km Pace" in lines[0]
-        )  # pace extracted from "(no faster than 8:40/mi)"
+END:VCALENDAR
+"""
 
-    def test_paced_step_no_rest(self) -> None:
-        lines = _parse_step_line("0.5mi at 6:45/mi")
-        assert len(lines) == 1
-        assert "0.8km" in lines[0]
-        assert "4:12/km" in lines[0]
+_LONG_RUN_ICS = """\
+BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Runna//EN
 
-    def test_paced_step_with_rest(self) -> None:
-        lines = _parse_step_line("0.25mi at 6:25/mi, 90s walking rest")
-        assert len(lines) == 2
-        assert "0.4km" in lines[0]
-        assert "3:59/km" in lines[0]
-        assert "9:19/km Pace" in lines[1]  # walking pace for rest
+BEGIN:VEVENT
+UID:UPCOMING_PLAN_WORKOUT-longrun001
+DTSTAMP:20260219
+DTSTART:20260223
+DTEND:20260224
+SUMMARY:🏃 6.5mi Long Run • 6.5mi
+DESCRIPTION:Long Run • 6.5mi • 55m - 1h0m\\n\\n6.5mi at a conversational pace\\n\\n📲 View in the Runna app: https://example.com
+X-WORKOUT-ESTIMATED-DURATION:3600
+END:VEVENT
 
-    def test_paced_step_with_range_note(self) -> None:
-        lines = _parse_step_line("0.5mi at 6:45/mi (6:30-7:00/mi), 90s walking rest")
-        assert len(lines) == 2
-        assert "4:12/km" in lines[0]
+END:VCALENDAR
+"""
 
-    def test_paced_step_with_race_pace_note(self) -> None:
-        lines = _parse_step_line("6mi at 7:15/mi (your target Half Marathon pace)")
-        assert len(lines) == 1
-        assert "9.7km" in lines[0]
-        assert "4:30/km" in lines[0]
+_KM_INTERVALS_ICS = """\
+BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Runna//EN
+
+BEGIN:VEVENT
+UID:UPCOMING_PLAN_WORKOUT-km001
+DTSTAMP:20260219
+DTSTART:20260401
+DTEND:20260402
+SUMMARY:🏃 Threshold Intervals • 8km
+DESCRIPTION:Intervals • 8km • 45m - 50m\\n\\n1.6km warm up at a conversational pace\\, 90s walking rest\\n\\n4 reps of:\\n• 0.8km at 4:12/km\\, 90s walking rest\\n\\n1.6km cool down\\n\\n📲 View in the Runna app: https://example.com
+X-WORKOUT-ESTIMATED-DURATION:2700
+END:VEVENT
 
-    def test_standalone_rest_under_minute(self) -> None:
-        lines = _parse_step_line("40s walking rest")
-        assert lines == ["- 40s 9:19/km Pace"]
+END:VCALENDAR
+"""
 
-    def test_standalone_rest_over_minute(self) -> None:
-        lines = _parse_step_line("60s walking rest")
-        assert lines == ["- 60s 9:19/km Pace"]
+_KM_EASY_RUN_ICS = """\
+BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Runna//EN
+
+BEGIN:VEVENT
+UID:UPCOMING_PLAN_WORKOUT-km002
+DTSTAMP:20260219
+DTSTART:20260402
+DTEND:20260403
+SUMMARY:🏃 Easy Run • 10km
+DESCRIPTION:Easy Run • 10km • 55m - 1h0m\\n\\n10km easy run at a conversational pace (no faster than 5:23/km). This is a limit\\, not a target!\\n\\n📲 View in the Runna app: https://example.com
+X-WORKOUT-ESTIMATED-DURATION:3300
+END:VEVENT
+
+END:VCALENDAR
+"""
 
-    def test_bullet_prefix_stripped(self) -> None:
-        lines = _parse_step_line("• 0.5mi at 6:45/mi, 90s walking rest")
-        assert len(lines) == 2
-        assert "4:12/km" in lines[0]
 
-    def test_empty_line(self) -> None:
-        assert _parse_step_line("") == []
+@cache
+def _cached_parse_ics(ics: str) -> list[IntervalsEvent]:
+    """Memoized parse_ics_to_events for tests that only read the result.
+
+    The returned list is shared between calls, so callers must not
+    mutate it.
+    """
+    return parse_ics_to_events(ics)
+
+
+class TestUnitConversions:
+    @pytest.mark.parametrize(
+        ("km", "expected"),
+        [(2.0, "2km"), (1.207, "1.2km")],
+    )
+    def test_fmt_km(self, km: float, expected: str) -> None:
+        assert _fmt_km(km) == expected
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [(40, "40s"), (90, "90s"), (120, "2m"), (150, "2m30s")],
+    )
+    def test_fmt_rest(self, seconds: int, expected: str) -> None:
+        assert _fmt_rest(seconds) == expected
+
+
+class TestParseStepLine:
+    @pytest.mark.parametrize(
+        ("line", "count", "contains"),
+        [
+            pytest.param(
+                "1.25mi warm up at a conversational pace (no faster than 8:40/mi), "
+                "90s walking rest",
+                2,
+                # 8:40/mi → 5:23/km; rest kept as seconds at walking pace
+                [(0, "2km"), (0, "5:23/km Pace"), (1, "90s"), (1, "9:19/km Pace")],
+                id="easy_warmup",
+            ),
+            pytest.param(
+                # No explicit pace — no fallback in step-line context — "easy"
+                "1.1mi cool down at a conversational pace (or slower!)",
+                1,
+                [(0, "1.8km"), (0, "easy")],
+                id="easy_cooldown",
+            ),
+            pytest.param(
+                "6mi easy run at a conversational pace (no faster than 8:40/mi). "
+                "This is a limit, not a target - run at whatever pace feels truly easy!",
+                1,
+                [(0, "9.7km"), (0, "5:23/km Pace")],
+                id="easy_run_no_rest",
+            ),
+            pytest.param(
+                "0.5mi at 6:45/mi",
+                1,
+                [(0, "0.8km"), (0, "4:12/km")],
+                id="paced_step_no_rest",
+            ),
+            pytest.param(
+                "0.25mi at 6:25/mi, 90s walking rest",
+                2,
+                [(0, "0.4km"), (0, "3:59/km"), (1, "9:19/km Pace")],
+                id="paced_step_with_rest",
+            ),
+            pytest.param(
+                "0.5mi at 6:45/mi (6:30-7:00/mi), 90s walking rest",
+                2,
+                [(0, "4:12/km")],
+                id="paced_step_with_range_note",
+            ),
+            pytest.param(
+                "6mi at 7:15/mi (your target Half Marathon pace)",
+                1,
+                [(0, "9.7km"), (0, "4:30/km")],
+                id="paced_step_with_race_pace_note",
+            ),
+            pytest.param(
+                "40s walking rest",
+                1,
+                [(0, "- 40s 9:19/km Pace")],
+                id="standalone_rest_under_minute",
+            ),
+            pytest.param(
+                "60s walking rest",
+                1,
+                [(0, "- 60s 9:19/km Pace")],
+                id="standalone_rest_over_minute",
+            ),
+            pytest.param(
+                "• 0.5mi at 6:45/mi, 90s walking rest",
+                2,
+                [(0, "4:12/km")],
+                id="bullet_prefix_stripped",
+            ),
+            pytest.param("", 0, [], id="empty_line"),
+        ],
+    )
+    def test_step_line(
+        self, line: str, count: int, contains: list[tuple[int, str]]
+    ) -> None:
+        lines = _parse_step_line(line)
+        assert len(lines) == count
+        for idx, substr in contains:
+            assert substr in lines[idx]
 
 
 class TestParseDescription:
@@ -110,7 +233,7 @@ class TestParseDescription:
             "This is a limit, not a target - run at whatever pace feels truly easy!\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
+        result = _cached_parse(desc)
         assert "5:23/km" in result  # pace from "(no faster than 8:40/mi)"
         assert "9.7km" in result
         # Header and app link stripped
@@ -127,12 +250,9 @@ class TestParseDescription:
             "1mi cool down at a conversational pace (or slower!)\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
-        assert "3x" in result
-        assert "1.2km" in result  # 0.75mi
-        assert "0.4km" in result  # 0.25mi
-        assert "Warmup" in result
-        assert "Cooldown" in result
+        result = _cached_parse(desc)
+        # 1.2km is 0.75mi, 0.4km is 0.25mi
+        _assert_all_in(result, "3x", "1.2km", "0.4km", "Warmup", "Cooldown")
 
     def test_repeat_following_format(self) -> None:
         desc = (
@@ -147,12 +267,10 @@ class TestParseDescription:
             "1.25mi cool down at a conversational pace (or slower!)\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
-        assert "4x" in result
-        assert "0.8km" in result
-        assert "4:18/km" in result  # 6:55/mi
-        assert "5:01/km" in result  # 8:05/mi
-        assert "9:19/km" in result  # walking pace for standalone rest
+        result = _cached_parse(desc)
+        # 4:18/km is 6:55/mi, 5:01/km is 8:05/mi, 9:19/km is the walking
+        # pace for the standalone rest
+        _assert_all_in(result, "4x", "0.8km", "4:18/km", "5:01/km", "9:19/km")
 
     def test_pyramid_intervals(self) -> None:
         """Multi-line paragraph of paced steps (no repeat block)."""
@@ -164,11 +282,9 @@ class TestParseDescription:
             "1.1mi cool down at a conversational pace (or slower!)\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
-        assert "3:44/km" in result  # 6:00/mi
-        assert "3:50/km" in result  # 6:10/mi
-        assert "Warmup" in result
-        assert "Cooldown" in result
+        result = _cached_parse(desc)
+        # 3:44/km is 6:00/mi, 3:50/km is 6:10/mi
+        _assert_all_in(result, "3:44/km", "3:50/km", "Warmup", "Cooldown")
 
     def test_standalone_rest_paragraph(self) -> None:
         desc = (
@@ -182,7 +298,7 @@ class TestParseDescription:
             "0.75mi cool down at a conversational pace (or slower!)\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
+        result = _cached_parse(desc)
         assert result.count("4x") == 2
         assert "9:19/km" in result  # walking pace for standalone 60s rest
 
@@ -192,89 +308,104 @@ class TestParseDescription:
             "5mi easy run at a conversational pace (no faster than 8:40/mi).\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
+        result = _cached_parse(desc)
         assert "\n\n\n" not in result
 
 
 class TestParseICSToEvents:
-    _MINIMAL_ICS = """\
-BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Runna//EN
-
-BEGIN:VEVENT
-UID:UPCOMING_PLAN_WORKOUT-abc123
-DTSTAMP:20260219
-DTSTART:20260401
-DTEND:20260402
-SUMMARY:🏃 Threshold Intervals • 5mi
-DESCRIPTION:Intervals • 5mi • 45m - 50m\\n\\n1mi warm up\\, 90s walking rest\\n\\n4 reps
- of:\\n• 0.5mi at 6:45/mi\\, 90s walking rest\\n\\n1mi cool down\\n\\n📲 View in the Runna
- app: https://example.com
-X-WORKOUT-ESTIMATED-DURATION:3000
-END:VEVENT
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parsed_minimal(
+        cls, tmp_path_factory: pytest.TempPathFactory
+    ) -> list[IntervalsEvent]:
+        """Parse _MINIMAL_ICS once for the whole class.
 
-END:VCALENDAR
-"""
+        Sets its own cache dir: the function-scoped cache isolation from
+        conftest is not yet active when a class-scoped fixture runs.
+        """
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+            return parse_ics_to_events(_MINIMAL_ICS)
 
-    def test_parses_single_event(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS)
-        assert len(events) == 1
+    def test_parses_single_event(self, parsed_minimal: list[IntervalsEvent]) -> None:
+        assert len(parsed_minimal) == 1
 
-    def test_event_name_clean(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS)
-        assert events[0].name == "Threshold Intervals"
-        assert "🏃" not in events[0].name
-        assert "• 5mi" not in events[0].name
+    def test_event_name_clean(self, parsed_minimal: list[IntervalsEvent]) -> None:
+        assert parsed_minimal[0].name == "Threshold Intervals"
+        assert "🏃" not in parsed_minimal[0].name
+        assert "• 5mi" not in parsed_minimal[0].name
 
-    def test_event_date(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS)
-        assert events[0].start_date_local == "2026-04-01T00:00:00"
+    def test_event_date(self, parsed_minimal: list[IntervalsEvent]) -> None:
+        assert parsed_minimal[0].start_date_local == "2026-04-01T00:00:00"
 
-    def test_event_moving_time(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS)
-        assert events[0].moving_time == 3000
+    def test_event_moving_time(self, parsed_minimal: list[IntervalsEvent]) -> None:
+        assert parsed_minimal[0].moving_time == 3000
 
-    def test_event_external_id(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS)
-        assert events[0].external_id == "runna-UPCOMING_PLAN_WORKOUT-abc123"
+    def test_event_external_id(self, parsed_minimal: list[IntervalsEvent]) -> None:
+        assert parsed_minimal[0].external_id == "runna-UPCOMING_PLAN_WORKOUT-abc123"
 
     def test_date_filter_start(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS, start_date="2026-05-01")
+        events = parse_ics_to_events(_MINIMAL_ICS, start_date="2026-05-01")
         assert len(events) == 0
 
     def test_date_filter_end(self) -> None:
-        events = parse_ics_to_events(self._MINIMAL_ICS, end_date="2026-03-01")
+        events = parse_ics_to_events(_MINIMAL_ICS, end_date="2026-03-01")
         assert len(events) == 0
 
     def test_date_filter_inclusive(self) -> None:
         events = parse_ics_to_events(
-            self._MINIMAL_ICS, start_date="2026-04-01", end_date="2026-04-01"
+            _MINIMAL_ICS, start_date="2026-04-01", end_date="2026-04-01"
         )
         assert len(events) == 1
 
-    _LONG_RUN_ICS = """\
-BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Runna//EN
-
-BEGIN:VEVENT
-UID:UPCOMING_PLAN_WORKOUT-longrun001
-DTSTAMP:20260219
-DTSTART:20260223
-DTEND:20260224
-SUMMARY:🏃 6.5mi Long Run • 6.5mi
-DESCRIPTION:Long Run • 6.5mi • 55m - 1h0m\\n\\n6.5mi at a conversational pace\\n\\n📲 View in the Runna app: https://example.com
-X-WORKOUT-ESTIMATED-DURATION:3600
-END:VEVENT
-
-END:VCALENDAR
-"""
+    def test_valarm_does_not_clobber_description(self) -> None:
+        """A nested VALARM reminder carries its own DESCRIPTION; the event
+        must keep its workout description (via the icalendar fallback)."""
+        ics = _MINIMAL_ICS.replace(
+            "END:VEVENT",
+            "BEGIN:VALARM\n"
+            "ACTION:DISPLAY\n"
+            "DESCRIPTION:Reminder\n"
+            "TRIGGER:-PT30M\n"
+            "END:VALARM\n"
+            "END:VEVENT",
+        )
+        events = parse_ics_to_events(ics)
+        assert len(events) == 1
+        assert "0.8km" in events[0].description
+        assert "Reminder" not in events[0].description
+
+    def test_limit_stops_early(self) -> None:
+        two_events = _MINIMAL_ICS.replace(
+            "END:VCALENDAR",
+            _MINIMAL_ICS[
+                _MINIMAL_ICS.find("BEGIN:VEVENT") : _MINIMAL_ICS.find(
+                    "END:VEVENT"
+                )
+            ].replace("abc123", "def456").replace("20260401", "20260403")
+            + "END:VEVENT\n\nEND:VCALENDAR",
+        )
+        assert len(parse_ics_to_events(two_events)) == 2
+        events = parse_ics_to_events(two_events, limit=1)
+        assert len(events) == 1
+        assert events[0].external_id == "runna-UPCOMING_PLAN_WORKOUT-abc123"
 
-    def test_easy_run_pace_derived_from_estimated_duration(self) -> None:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parsed_long_run(
+        cls, tmp_path_factory: pytest.TempPathFactory
+    ) -> list[IntervalsEvent]:
+        """Parse _LONG_RUN_ICS once for the whole class."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+            return parse_ics_to_events(_LONG_RUN_ICS)
+
+    def test_easy_run_pace_derived_from_estimated_duration(
+        self, parsed_long_run: list[IntervalsEvent]
+    ) -> None:
         """A plain 'conversational pace' run should get a concrete sec/km pace
         derived from X-WORKOUT-ESTIMATED-DURATION ÷ distance, not a %pace zone."""
-        events = parse_ics_to_events(self._LONG_RUN_ICS)
+        events = parsed_long_run
         assert len(events) == 1
         wdoc = events[0].workout_doc
         assert wdoc is not None
@@ -295,15 +426,14 @@ END:VCALENDAR
             "1.1mi cool down at a conversational pace (or slower!)\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        km_result = _parse_description(desc, use_miles=False)
-        mi_result = _parse_description(desc, use_miles=True)
+        km_result = _cached_parse(desc)
+        mi_result = _cached_parse(desc, use_miles=True)
 
         assert "km" in km_result
         assert "mi" in mi_result
-        assert "8:40/mi Pace" in mi_result  # warmup pace in miles
-        assert "15:00/mi Pace" in mi_result  # walking rest in miles
-        assert "1.25mi" in mi_result
-        assert "1.1mi" in mi_result  # cooldown uses fallback from warmup
+        # 8:40/mi is the warmup pace, 15:00/mi the walking rest; the
+        # 1.1mi cooldown uses the fallback pace from the warmup
+        _assert_all_in(mi_result, "8:40/mi Pace", "15:00/mi Pace", "1.25mi", "1.1mi")
 
 
 class TestKmFormatParsing:
@@ -341,15 +471,13 @@ class TestKmFormatParsing:
 
     def test_paced_step_km_miles_output(self) -> None:
         """km input with use_miles=True output should give miles/min-per-mile."""
-        from runna_intervals.runna.ics_parser import _parse_description
-
         desc = (
             "Easy Run • 10km • 50m - 55m\n\n"
             "10km easy run at a conversational pace (no faster than 5:23/km).\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        mi_result = _parse_description(desc, use_miles=True)
-        km_result = _parse_description(desc, use_miles=False)
+        mi_result = _cached_parse(desc, use_miles=True)
+        km_result = _cached_parse(desc)
 
         assert "km" in km_result
         assert "mi" in mi_result
@@ -358,8 +486,6 @@ class TestKmFormatParsing:
 
     def test_parse_description_km_intervals(self) -> None:
         """Full km-format workout with repeat block."""
-        from runna_intervals.runna.ics_parser import _parse_description
-
         desc = (
             "Intervals • 8km • 45m - 50m\n\n"
             "1.6km warm up at a conversational pace (no faster than 5:23/km), 90s walking rest\n\n"
@@ -368,35 +494,14 @@ class TestKmFormatParsing:
             "1.6km cool down at a conversational pace (or slower!)\n\n"
             "📲 View in the Runna app: https://example.com"
         )
-        result = _parse_description(desc)
-        assert "4x" in result
-        assert "1.6km" in result
-        assert "0.8km" in result
-        assert "4:12/km" in result
-        assert "5:23/km" in result
-        assert "Warmup" in result
-        assert "Cooldown" in result
+        result = _cached_parse(desc)
+        _assert_all_in(
+            result, "4x", "1.6km", "0.8km", "4:12/km", "5:23/km", "Warmup", "Cooldown"
+        )
 
     def test_ics_km_format_event_name_clean(self) -> None:
         """SUMMARY with km suffix is stripped correctly."""
-        ics = """\
-BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Runna//EN
-
-BEGIN:VEVENT
-UID:UPCOMING_PLAN_WORKOUT-km001
-DTSTAMP:20260219
-DTSTART:20260401
-DTEND:20260402
-SUMMARY:🏃 Threshold Intervals • 8km
-DESCRIPTION:Intervals • 8km • 45m - 50m\\n\\n1.6km warm up at a conversational pace\\, 90s walking rest\\n\\n4 reps of:\\n• 0.8km at 4:12/km\\, 90s walking rest\\n\\n1.6km cool down\\n\\n📲 View in the Runna app: https://example.com
-X-WORKOUT-ESTIMATED-DURATION:2700
-END:VEVENT
-
-END:VCALENDAR
-"""
-        events = parse_ics_to_events(ics)
+        events = _cached_parse_ics(_KM_INTERVALS_ICS)
         assert len(events) == 1
         assert events[0].name == "Threshold Intervals"
         assert "8km" not in events[0].name
@@ -404,24 +509,7 @@ END:VCALENDAR
 
     def test_ics_km_format_description(self) -> None:
         """Full km-format ICS produces valid description with correct paces."""
-        ics = """\
-BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Runna//EN
-
-BEGIN:VEVENT
-UID:UPCOMING_PLAN_WORKOUT-km002
-DTSTAMP:20260219
-DTSTART:20260402
-DTEND:20260403
-SUMMARY:🏃 Easy Run • 10km
-DESCRIPTION:Easy Run • 10km • 55m - 1h0m\\n\\n10km easy run at a conversational pace (no faster than 5:23/km). This is a limit\\, not a target!\\n\\n📲 View in the Runna app: https://example.com
-X-WORKOUT-ESTIMATED-DURATION:3300
-END:VEVENT
-
-END:VCALENDAR
-"""
-        events = parse_ics_to_events(ics)
+        events = _cached_parse_ics(_KM_EASY_RUN_ICS)
         assert len(events) == 1
         assert "10km" in events[0].description
         assert "5:23/km" in events[0].description
@@ -1,7 +1,8 @@
 """Tests for the Intervals.icu API client."""
 
-import json
+from collections.abc import Callable
 
+import orjson
 import pytest
 from pydantic import SecretStr
 from pytest_httpx import HTTPXMock
@@ -9,11 +10,33 @@ from pytest_httpx import HTTPXMock
 from runna_intervals.intervals_client import IntervalsAPIError, IntervalsClient
 from runna_intervals.models.intervals import IntervalsEvent
 
+# Every test here consumes exactly the responses it registers, so skip
+# pytest-httpx's leftover-response check (and its diagnostic string
+# building) at teardown.
+pytestmark = pytest.mark.httpx_mock(assert_all_responses_were_requested=False)
+
 
 BASE = "https://intervals.icu"
 ATHLETE = "i99"
 API_KEY = SecretStr("test-key")
 
+# Endpoint URLs built once at import instead of re-interpolated per test
+ATHLETE_URL = f"{BASE}/api/v1/athlete/{ATHLETE}"
+EVENTS_URL = f"{ATHLETE_URL}/events"
+BULK_URL = f"{ATHLETE_URL}/events/bulk?upsert=true"
+BULK_URL_NO_UPSERT = f"{ATHLETE_URL}/events/bulk"
+
+def _request_count(mock: HTTPXMock) -> int:
+    """Number of requests the mock recorded.
+
+    get_requests() builds a filtered list copy just to be len()'d here;
+    read the underlying list directly when it exists and fall back to
+    the public API if pytest-httpx renames it.
+    """
+    recorded = getattr(mock, "_requests", None)
+    return len(recorded) if recorded is not None else len(mock.get_requests())
+
+
 EVENT = IntervalsEvent(
     start_date_local="2026-03-01T00:00:00",
     name="Easy Run",
@@ -23,7 +46,10 @@ EVENT = IntervalsEvent(
 )
 
 
-@pytest.fixture()
+# Module-scoped so the underlying httpx.Client (connection pool, SSL context)
+# is built once for the whole file. pytest-httpx patches the transport class,
+# not the instance, so the per-test httpx_mock still intercepts every request.
+@pytest.fixture(scope="module")
 def client() -> IntervalsClient:
     return IntervalsClient(api_key=API_KEY, athlete_id=ATHLETE, base_url=BASE)
 
@@ -38,7 +64,7 @@ class TestUploadEvents:
         returned = [{"id": 1, "name": "Easy Run"}]
         httpx_mock.add_response(
             method="POST",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events/bulk?upsert=true",
+            url=BULK_URL,
             json=returned,
         )
         result = client.upload_events([EVENT])
@@ -49,7 +75,7 @@ class TestUploadEvents:
     ) -> None:
         httpx_mock.add_response(
             method="POST",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events/bulk",
+            url=BULK_URL_NO_UPSERT,
             json=[],
         )
         result = client.upload_events([EVENT], upsert=False)
@@ -60,25 +86,37 @@ class TestUploadEvents:
     ) -> None:
         httpx_mock.add_response(
             method="POST",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events/bulk?upsert=true",
+            url=BULK_URL,
             json=[{"id": 1}],
         )
         client.upload_events([EVENT])
         request = httpx_mock.get_request()
-        body = json.loads(request.content)  # type: ignore[union-attr]
-        assert body[0]["external_id"] == "runna-abc123"
+        # orjson emits compact JSON, so the key/value pair can be checked
+        # as a raw bytes substring without decoding the body
+        assert request is not None
+        assert b'"external_id":"runna-abc123"' in request.content
 
-    def test_raises_on_401(self, client: IntervalsClient, httpx_mock: HTTPXMock) -> None:
-        httpx_mock.add_response(
-            method="POST",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events/bulk?upsert=true",
-            status_code=401,
-            json={"message": "Unauthorized"},
-        )
-        with pytest.raises(IntervalsAPIError) as exc_info:
-            client.upload_events([EVENT])
-        assert exc_info.value.status_code == 401
-        assert "API key" in str(exc_info.value)
+    def test_large_upload_is_chunked(
+        self, client: IntervalsClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """120 events split into chunks of 50, results aggregated in order."""
+        events = [EVENT.model_copy(update={"external_id": f"runna-{i}"}) for i in range(120)]
+
+        def echo_ids(request):  # type: ignore[no-untyped-def]
+            import httpx
+
+            body = orjson.loads(request.content)
+            return httpx.Response(200, json=[{"external_id": e["external_id"]} for e in body])
+
+        for _ in range(3):
+            httpx_mock.add_callback(
+                echo_ids,
+                method="POST",
+                url=BULK_URL,
+            )
+        results = client.upload_events(events)
+        assert _request_count(httpx_mock) == 3
+        assert [r["external_id"] for r in results] == [f"runna-{i}" for i in range(120)]
 
 
 # ---------------------------------------------------------------------------
@@ -91,7 +129,7 @@ class TestGetEvents:
         events = [{"id": 10, "name": "Threshold Run", "start_date_local": "2026-04-01"}]
         httpx_mock.add_response(
             method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events?oldest=2026-04-01&newest=2026-04-30",
+            url=f"{EVENTS_URL}?oldest=2026-04-01&newest=2026-04-30",
             json=events,
         )
         result = client.get_events("2026-04-01", "2026-04-30")
@@ -100,22 +138,49 @@ class TestGetEvents:
     def test_empty_range(self, client: IntervalsClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
             method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events?oldest=2026-01-01&newest=2026-01-01",
+            url=f"{EVENTS_URL}?oldest=2026-01-01&newest=2026-01-01",
             json=[],
         )
         assert client.get_events("2026-01-01", "2026-01-01") == []
 
-    def test_raises_on_404(self, client: IntervalsClient, httpx_mock: HTTPXMock) -> None:
+    def test_filter_params_forwarded(
+        self, client: IntervalsClient, httpx_mock: HTTPXMock
+    ) -> None:
         httpx_mock.add_response(
             method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events?oldest=2026-01-01&newest=2026-01-31",
-            status_code=404,
-            json={"message": "athlete not found"},
+            url=(
+                f"{EVENTS_URL}"
+                "?oldest=2026-04-01&newest=2026-04-30"
+                "&external_id_prefix=runna-&fields=id,external_id"
+            ),
+            json=[],
         )
-        with pytest.raises(IntervalsAPIError) as exc_info:
-            client.get_events("2026-01-01", "2026-01-31")
-        assert exc_info.value.status_code == 404
-        assert ATHLETE in str(exc_info.value)
+        assert (
+            client.get_events(
+                "2026-04-01",
+                "2026-04-30",
+                external_id_prefix="runna-",
+                fields="id,external_id",
+            )
+            == []
+        )
+
+    def test_304_returns_cached_body(
+        self, client: IntervalsClient, httpx_mock: HTTPXMock
+    ) -> None:
+        events = [{"id": 10, "name": "Threshold Run"}]
+        url = f"{EVENTS_URL}?oldest=2026-04-01&newest=2026-04-30"
+        httpx_mock.add_response(
+            method="GET", url=url, json=events, headers={"ETag": '"v1"'}
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=url,
+            status_code=304,
+            match_headers={"If-None-Match": '"v1"'},
+        )
+        assert client.get_events("2026-04-01", "2026-04-30") == events
+        assert client.get_events("2026-04-01", "2026-04-30") == events
 
 
 # ---------------------------------------------------------------------------
@@ -127,22 +192,49 @@ class TestDeleteEvent:
     def test_success(self, client: IntervalsClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
             method="DELETE",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events/42",
+            url=f"{EVENTS_URL}/42",
             status_code=200,
             json={},
         )
         client.delete_event(42)  # should not raise
 
-    def test_raises_on_403(self, client: IntervalsClient, httpx_mock: HTTPXMock) -> None:
+
+class TestDeleteEvents:
+    def test_deletes_all(self, client: IntervalsClient, httpx_mock: HTTPXMock) -> None:
+        for event_id in (1, 2, 3):
+            httpx_mock.add_response(
+                method="DELETE",
+                url=f"{EVENTS_URL}/{event_id}",
+                json={},
+            )
+        results = client.delete_events([1, 2, 3])
+        assert sorted(eid for eid, _ in results) == [1, 2, 3]
+        assert all(error is None for _, error in results)
+
+    def test_reports_per_event_errors(
+        self, client: IntervalsClient, httpx_mock: HTTPXMock
+    ) -> None:
         httpx_mock.add_response(
             method="DELETE",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events/99",
-            status_code=403,
-            json={"message": "Forbidden"},
+            url=f"{EVENTS_URL}/1",
+            json={},
         )
-        with pytest.raises(IntervalsAPIError) as exc_info:
-            client.delete_event(99)
-        assert exc_info.value.status_code == 403
+        httpx_mock.add_response(
+            method="DELETE",
+            url=f"{EVENTS_URL}/2",
+            status_code=404,
+            json={"message": "not found"},
+        )
+        results = dict(client.delete_events([1, 2]))
+        assert results[1] is None
+        assert isinstance(results[2], IntervalsAPIError)
+        assert results[2].status_code == 404
+
+    def test_empty_list_makes_no_requests(
+        self, client: IntervalsClient, httpx_mock: HTTPXMock
+    ) -> None:
+        assert client.delete_events([]) == []
+        assert _request_count(httpx_mock) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -155,7 +247,7 @@ class TestGetAthlete:
         profile = {"id": ATHLETE, "name": "Test Athlete"}
         httpx_mock.add_response(
             method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}",
+            url=ATHLETE_URL,
             json=profile,
         )
         result = client.get_athlete()
@@ -167,45 +259,91 @@ class TestGetAthlete:
         """Regression: get_athlete must make exactly one HTTP request."""
         httpx_mock.add_response(
             method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}",
+            url=ATHLETE_URL,
             json={"id": ATHLETE},
         )
         client.get_athlete()
-        assert len(httpx_mock.get_requests()) == 1
+        assert _request_count(httpx_mock) == 1
 
 
 # ---------------------------------------------------------------------------
-# _raise_for_status — generic error branch
+# _raise_for_status — error status matrix
 # ---------------------------------------------------------------------------
 
 
 class TestRaiseForStatus:
-    def test_generic_error_with_json_message(
-        self, client: IntervalsClient, httpx_mock: HTTPXMock
+    @pytest.mark.parametrize(
+        ("method", "url", "status", "body", "expected_substr", "call"),
+        [
+            pytest.param(
+                "POST",
+                BULK_URL,
+                401,
+                {"message": "Unauthorized"},
+                "API key",
+                lambda c: c.upload_events([EVENT]),
+                id="upload-401",
+            ),
+            pytest.param(
+                "DELETE",
+                f"{EVENTS_URL}/99",
+                403,
+                {"message": "Forbidden"},
+                None,
+                lambda c: c.delete_event(99),
+                id="delete-403",
+            ),
+            pytest.param(
+                "GET",
+                f"{EVENTS_URL}?oldest=2026-01-01&newest=2026-01-31",
+                404,
+                {"message": "athlete not found"},
+                ATHLETE,
+                lambda c: c.get_events("2026-01-01", "2026-01-31"),
+                id="get-404",
+            ),
+            pytest.param(
+                "GET",
+                f"{EVENTS_URL}?oldest=x&newest=y",
+                422,
+                {"message": "Invalid date format"},
+                "Invalid date format",
+                lambda c: c.get_events("x", "y"),
+                id="get-422-json-message",
+            ),
+            pytest.param(
+                "GET",
+                f"{EVENTS_URL}?oldest=x&newest=y",
+                500,
+                None,  # plain-text body, not JSON
+                None,
+                lambda c: c.get_events("x", "y"),
+                id="get-500-plain-text",
+            ),
+        ],
+    )
+    def test_error_status(
+        self,
+        client: IntervalsClient,
+        httpx_mock: HTTPXMock,
+        method: str,
+        url: str,
+        status: int,
+        body: dict[str, str] | None,
+        expected_substr: str | None,
+        call: Callable[[IntervalsClient], object],
     ) -> None:
-        httpx_mock.add_response(
-            method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events?oldest=x&newest=y",
-            status_code=422,
-            json={"message": "Invalid date format"},
-        )
-        with pytest.raises(IntervalsAPIError) as exc_info:
-            client.get_events("x", "y")
-        assert exc_info.value.status_code == 422
-        assert "Invalid date format" in str(exc_info.value)
-
-    def test_generic_error_with_plain_text(
-        self, client: IntervalsClient, httpx_mock: HTTPXMock
-    ) -> None:
-        httpx_mock.add_response(
-            method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}/events?oldest=x&newest=y",
-            status_code=500,
-            text="Internal Server Error",
-        )
+        if body is None:
+            httpx_mock.add_response(
+                method=method, url=url, status_code=status, text="Internal Server Error"
+            )
+        else:
+            httpx_mock.add_response(method=method, url=url, status_code=status, json=body)
         with pytest.raises(IntervalsAPIError) as exc_info:
-            client.get_events("x", "y")
-        assert exc_info.value.status_code == 500
+            call(client)
+        assert exc_info.value.status_code == status
+        if expected_substr is not None:
+            assert expected_substr in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
@@ -217,7 +355,7 @@ class TestContextManager:
     def test_can_be_used_as_context_manager(self, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
             method="GET",
-            url=f"{BASE}/api/v1/athlete/{ATHLETE}",
+            url=ATHLETE_URL,
             json={"id": ATHLETE},
         )
         with IntervalsClient(api_key=API_KEY, athlete_id=ATHLETE, base_url=BASE) as c: